@@ -7,9 +7,21 @@ import os
 from datetime import datetime, timedelta
 from typing import List, Optional
 import amberelectric
+from urllib3.util.retry import Retry
 from amberelectric.api import amber_api
 from amberelectric.api.amber_api import Site, Usage
 
+# Retry transient failures and rate limiting with backoff instead of failing the chunk
+API_RETRIES = Retry(
+    total=3,
+    backoff_factor=0.3,
+    status_forcelist=[429, 500, 502, 503, 504],
+    allowed_methods=['GET'],
+)
+
+# Keep-alive connections held open to the API host (covers parallel prefetch)
+API_POOL_MAXSIZE = 10
+
 
 class AmberClient:
     """Wrapper class for Amber Electric API interactions."""
@@ -29,6 +41,8 @@ class AmberClient:
             
         # Configure the API client for v2.0.12
         amber_configuration = amberelectric.Configuration(access_token=api_token)
+        amber_configuration.retries = API_RETRIES
+        amber_configuration.connection_pool_maxsize = API_POOL_MAXSIZE
         api_client = amberelectric.ApiClient(amber_configuration)
         self.client = amber_api.AmberApi(api_client)
     
@@ -25,6 +25,10 @@ class Config:
     COLLECTION_INTERVAL_MINUTES: int = int(os.getenv('COLLECTION_INTERVAL_MINUTES', '5'))
     FORCE_REINIT: bool = os.getenv('FORCE_REINIT', '').lower() == 'true'
     
+    # Amber API request pacing
+    API_MAX_WORKERS: int = int(os.getenv('API_MAX_WORKERS', '4'))
+    API_REQUEST_INTERVAL_SECONDS: float = float(os.getenv('API_REQUEST_INTERVAL_SECONDS', '2'))
+    
     # Forecast collection configuration
     COLLECT_FORECASTS: bool = os.getenv('COLLECT_FORECASTS', 'true').lower() == 'true'
     FORECAST_HOURS_AHEAD: int = int(os.getenv('FORECAST_HOURS_AHEAD', '24'))
@@ -2,15 +2,92 @@
 Database service for Amber-Home application.
 """
 
+import csv
+import io
 import logging
 from datetime import datetime
 from typing import Optional, List
 import psycopg2
-from psycopg2.extras import RealDictCursor
+from psycopg2.extras import RealDictCursor, execute_values
 from .config import Config
 
 logger = logging.getLogger(__name__)
 
+# Rows sent per multi-row INSERT statement
+BATCH_PAGE_SIZE = 500
+
+# Batches at least this large (historical backfill) are loaded with COPY
+COPY_THRESHOLD = 2000
+
+# Indexes retired from schema.sql, keyed to the index that replaces them. They
+# are only dropped once the replacement exists so a failed CREATE never leaves
+# the column unindexed.
+SUPERSEDED_INDEXES = {
+    'idx_price_data_nem_time': 'idx_price_data_nem_time_covering',
+    'idx_price_forecasts_generated_at': 'idx_price_forecasts_generated_nem_time',
+}
+
+PRICE_COLUMNS = (
+    'site_id', 'nem_time', 'start_time', 'end_time', 'duration', 'channel_type',
+    'per_kwh', 'spot_per_kwh', 'renewables', 'spike_status', 'descriptor',
+    'estimate', 'var_date',
+)
+PRICE_ON_CONFLICT = """
+    ON CONFLICT (site_id, nem_time, channel_type) DO UPDATE SET
+        per_kwh = EXCLUDED.per_kwh,
+        spot_per_kwh = EXCLUDED.spot_per_kwh,
+        renewables = EXCLUDED.renewables,
+        spike_status = EXCLUDED.spike_status,
+        descriptor = EXCLUDED.descriptor,
+        estimate = EXCLUDED.estimate
+"""
+
+USAGE_COLUMNS = (
+    'site_id', 'nem_time', 'start_time', 'end_time', 'duration', 'channel_id',
+    'channel_type', 'kwh', 'cost', 'quality', 'descriptor', 'var_date',
+)
+USAGE_ON_CONFLICT = """
+    ON CONFLICT (site_id, nem_time, channel_id) DO UPDATE SET
+        kwh = EXCLUDED.kwh,
+        cost = EXCLUDED.cost,
+        quality = EXCLUDED.quality,
+        descriptor = EXCLUDED.descriptor
+"""
+
+FORECAST_COLUMNS = (
+    'site_id', 'nem_time', 'start_time', 'end_time', 'duration', 'channel_type',
+    'per_kwh', 'spot_per_kwh', 'renewables', 'spike_status', 'descriptor',
+    'estimate', 'forecast_type', 'range_low', 'range_high',
+    'advanced_price_low', 'advanced_price_predicted', 'advanced_price_high',
+    'forecast_generated_at', 'var_date',
+)
+FORECAST_ON_CONFLICT = """
+    ON CONFLICT (site_id, nem_time, channel_type, forecast_generated_at) DO UPDATE SET
+        per_kwh = EXCLUDED.per_kwh,
+        spot_per_kwh = EXCLUDED.spot_per_kwh,
+        renewables = EXCLUDED.renewables,
+        descriptor = EXCLUDED.descriptor,
+        range_low = EXCLUDED.range_low,
+        range_high = EXCLUDED.range_high,
+        advanced_price_low = EXCLUDED.advanced_price_low,
+        advanced_price_predicted = EXCLUDED.advanced_price_predicted,
+        advanced_price_high = EXCLUDED.advanced_price_high
+"""
+
+
+def _optional_str(obj, attr: str) -> Optional[str]:
+    """Text form of an optional SDK attribute, looked up once; falsy values store as NULL."""
+    value = getattr(obj, attr, None)
+    return str(value) if value else None
+
+
+def _unique_rows(rows: List[tuple], key_indexes: tuple) -> List[tuple]:
+    """Keep the last row per conflict key - one statement can't update a row twice."""
+    unique = {}
+    for row in rows:
+        unique[tuple(row[i] for i in key_indexes)] = row
+    return list(unique.values())
+
 
 class DatabaseService:
     """Database operations service."""
@@ -85,6 +162,7 @@ class DatabaseService:
                         self.connection.rollback()
                         continue
                 
+                self._drop_superseded_indexes(cursor)
                 logger.info("Database schema ensured")
                 
         except Exception as e:
@@ -92,6 +170,17 @@ class DatabaseService:
             self.connection.rollback()
             raise
     
+    def _drop_superseded_indexes(self, cursor) -> None:
+        """Drop retired indexes whose replacement index is in place."""
+        for old_index, replacement in SUPERSEDED_INDEXES.items():
+            cursor.execute("SELECT to_regclass(%s) IS NOT NULL", (replacement,))
+            if not cursor.fetchone()[0]:
+                logger.warning(f"Keeping {old_index}: replacement index {replacement} is missing")
+                continue
+            
+            cursor.execute(f"DROP INDEX IF EXISTS {old_index}")
+            self.connection.commit()
+    
     def get_site_count(self) -> int:
         """Get count of sites in database."""
         if not self.connection:
@@ -162,23 +251,22 @@ class DatabaseService:
             start_date = Config.get_historical_start_date()
             
             with self.connection.cursor() as cursor:
-                cursor.execute("SELECT COUNT(*) FROM sites")
-                site_count = cursor.fetchone()[0]
-                
-                cursor.execute("SELECT COUNT(*) FROM price_data WHERE nem_time >= %s", (start_date,))
-                price_from_start = cursor.fetchone()[0]
-                
-                cursor.execute("SELECT COUNT(*) FROM usage_data WHERE nem_time >= %s", (start_date,))
-                usage_from_start = cursor.fetchone()[0]
+                # Existence probes stop at the first matching row instead of counting whole tables
+                cursor.execute("""
+                    SELECT
+                        EXISTS (SELECT 1 FROM sites),
+                        EXISTS (SELECT 1 FROM price_data WHERE nem_time >= %s),
+                        EXISTS (SELECT 1 FROM usage_data WHERE nem_time >= %s)
+                """, (start_date, start_date))
+                has_sites, has_price_from_start, has_usage_from_start = cursor.fetchone()
                 
-                has_sites = site_count > 0
-                has_data_from_start = price_from_start > 0 and usage_from_start > 0
+                has_data_from_start = has_price_from_start and has_usage_from_start
                 
                 if has_sites and has_data_from_start:
-                    logger.info(f"Database initialized with {site_count} sites, {price_from_start} price records, {usage_from_start} usage records from {start_date}")
+                    logger.info(f"Database initialized with sites, price and usage records from {start_date}")
                     return True
                 else:
-                    logger.info(f"Database not fully initialized - sites: {site_count}, price from start: {price_from_start}, usage from start: {usage_from_start}")
+                    logger.info(f"Database not fully initialized - sites: {has_sites}, price from start: {has_price_from_start}, usage from start: {has_usage_from_start}")
                     return False
                     
         except Exception as e:
@@ -191,13 +279,12 @@ class DatabaseService:
             raise RuntimeError("Database not connected")
         
         with self.connection.cursor() as cursor:
-            for site in sites:
-                cursor.execute("""
-                    INSERT INTO sites (id, nmi)
-                    VALUES (%s, %s)
-                    ON CONFLICT (id) DO UPDATE SET
-                        nmi = EXCLUDED.nmi
-                """, (site.id, site.nmi))
+            execute_values(cursor, """
+                INSERT INTO sites (id, nmi)
+                VALUES %s
+                ON CONFLICT (id) DO UPDATE SET
+                    nmi = EXCLUDED.nmi
+            """, [(site.id, site.nmi) for site in sites])
             
             self.connection.commit()
             logger.info(f"Inserted {len(sites)} sites")
@@ -207,145 +294,153 @@ class DatabaseService:
         if not self.connection:
             raise RuntimeError("Database not connected")
         
-        with self.connection.cursor() as cursor:
-            for price in prices:
-                # Handle new SDK v2.0.12 structure - get actual instance
-                price_data = price.actual_instance if hasattr(price, 'actual_instance') else price
-                
-                cursor.execute("""
-                    INSERT INTO price_data (
-                        site_id, nem_time, start_time, end_time, duration, channel_type, 
-                        per_kwh, spot_per_kwh, renewables, spike_status, descriptor, 
-                        estimate, var_date
-                    )
-                    VALUES (%s, %s, %s, %s, %s, %s, %s, %s, %s, %s, %s, %s, %s)
-                    ON CONFLICT (site_id, nem_time, channel_type) DO UPDATE SET
-                        per_kwh = EXCLUDED.per_kwh,
-                        spot_per_kwh = EXCLUDED.spot_per_kwh,
-                        renewables = EXCLUDED.renewables,
-                        spike_status = EXCLUDED.spike_status,
-                        descriptor = EXCLUDED.descriptor,
-                        estimate = EXCLUDED.estimate
-                """, (
-                    site_id,
-                    price_data.nem_time,
-                    getattr(price_data, 'start_time', None),
-                    getattr(price_data, 'end_time', None),
-                    getattr(price_data, 'duration', None),
-                    str(price_data.channel_type),
-                    price_data.per_kwh,
-                    price_data.spot_per_kwh,
-                    price_data.renewables,
-                    str(getattr(price_data, 'spike_status', None)) if getattr(price_data, 'spike_status', None) else None,
-                    str(getattr(price_data, 'descriptor', None)) if getattr(price_data, 'descriptor', None) else None,
-                    getattr(price_data, 'estimate', False),
-                    getattr(price_data, 'var_date', None)
-                ))
+        rows = []
+        for price in prices:
+            # Handle new SDK v2.0.12 structure - get actual instance
+            price_data = price.actual_instance if hasattr(price, 'actual_instance') else price
+            
+            rows.append((
+                site_id,
+                price_data.nem_time,
+                getattr(price_data, 'start_time', None),
+                getattr(price_data, 'end_time', None),
+                getattr(price_data, 'duration', None),
+                str(price_data.channel_type),
+                price_data.per_kwh,
+                price_data.spot_per_kwh,
+                price_data.renewables,
+                _optional_str(price_data, 'spike_status'),
+                _optional_str(price_data, 'descriptor'),
+                getattr(price_data, 'estimate', False),
+                getattr(price_data, 'var_date', None)
+            ))
         
-        self.connection.commit()
+        self._write_rows('price_data', PRICE_COLUMNS, PRICE_ON_CONFLICT, _unique_rows(rows, (0, 1, 5)))
     
-    def insert_usage_data(self, site_id: str, usage_data: List) -> None:
-        """Insert usage data into database."""
+    def insert_usage_data(self, site_id: str, usage_data: List) -> int:
+        """Insert usage data into database, returning the number of rows written."""
         if not self.connection:
             raise RuntimeError("Database not connected")
         
-        with self.connection.cursor() as cursor:
-            for usage in usage_data:
-                # Get raw channel_id from API - now available as channel_identifier
-                channel_id = getattr(usage, 'channel_identifier', None)
-                
-                cursor.execute("""
-                    INSERT INTO usage_data (
-                        site_id, nem_time, start_time, end_time, duration, channel_id, 
-                        channel_type, kwh, cost, quality, descriptor, var_date
-                    )
-                    VALUES (%s, %s, %s, %s, %s, %s, %s, %s, %s, %s, %s, %s)
-                    ON CONFLICT (site_id, nem_time, channel_id) DO UPDATE SET
-                        kwh = EXCLUDED.kwh,
-                        cost = EXCLUDED.cost,
-                        quality = EXCLUDED.quality,
-                        descriptor = EXCLUDED.descriptor
-                """, (
-                    site_id,
-                    usage.nem_time,
-                    getattr(usage, 'start_time', None),
-                    getattr(usage, 'end_time', None),
-                    getattr(usage, 'duration', None),
-                    channel_id,
-                    str(usage.channel_type),
-                    usage.kwh,
-                    usage.cost,
-                    usage.quality,
-                    str(getattr(usage, 'descriptor', None)) if getattr(usage, 'descriptor', None) else None,
-                    getattr(usage, 'var_date', None)
-                ))
+        rows = []
+        for usage in usage_data:
+            # Get raw channel_id from API - now available as channel_identifier
+            channel_id = getattr(usage, 'channel_identifier', None)
+            
+            rows.append((
+                site_id,
+                usage.nem_time,
+                getattr(usage, 'start_time', None),
+                getattr(usage, 'end_time', None),
+                getattr(usage, 'duration', None),
+                channel_id,
+                str(usage.channel_type),
+                usage.kwh,
+                usage.cost,
+                usage.quality,
+                _optional_str(usage, 'descriptor'),
+                getattr(usage, 'var_date', None)
+            ))
         
-        self.connection.commit()
+        return self._write_rows('usage_data', USAGE_COLUMNS, USAGE_ON_CONFLICT, _unique_rows(rows, (0, 1, 5)))
     
     def insert_forecast_data(self, site_id: str, forecast_data: List, forecast_generated_at: datetime) -> None:
         """Insert forecast price data into database."""
         if not self.connection:
             raise RuntimeError("Database not connected")
         
-        with self.connection.cursor() as cursor:
-            for forecast in forecast_data:
-                # Extract forecast-specific fields
-                forecast_type = getattr(forecast, 'type', 'Unknown')
-                
-                # Extract range data if available
-                range_data = getattr(forecast, 'range', None)
-                range_low = getattr(range_data, 'low', None) if range_data else None
-                range_high = getattr(range_data, 'high', None) if range_data else None
-                
-                # Extract advanced price data if available
-                advanced_price = getattr(forecast, 'advanced_price', None)
-                advanced_low = getattr(advanced_price, 'low', None) if advanced_price else None
-                advanced_predicted = getattr(advanced_price, 'predicted', None) if advanced_price else None
-                advanced_high = getattr(advanced_price, 'high', None) if advanced_price else None
-                
-                cursor.execute("""
-                    INSERT INTO price_forecasts (
-                        site_id, nem_time, start_time, end_time, duration, channel_type, 
-                        per_kwh, spot_per_kwh, renewables, spike_status, descriptor, 
-                        estimate, forecast_type, range_low, range_high, 
-                        advanced_price_low, advanced_price_predicted, advanced_price_high,
-                        forecast_generated_at, var_date
-                    )
-                    VALUES (%s, %s, %s, %s, %s, %s, %s, %s, %s, %s, %s, %s, %s, %s, %s, %s, %s, %s, %s, %s)
-                    ON CONFLICT (site_id, nem_time, channel_type, forecast_generated_at) DO UPDATE SET
-                        per_kwh = EXCLUDED.per_kwh,
-                        spot_per_kwh = EXCLUDED.spot_per_kwh,
-                        renewables = EXCLUDED.renewables,
-                        descriptor = EXCLUDED.descriptor,
-                        range_low = EXCLUDED.range_low,
-                        range_high = EXCLUDED.range_high,
-                        advanced_price_low = EXCLUDED.advanced_price_low,
-                        advanced_price_predicted = EXCLUDED.advanced_price_predicted,
-                        advanced_price_high = EXCLUDED.advanced_price_high
-                """, (
-                    site_id,
-                    forecast.nem_time,
-                    getattr(forecast, 'start_time', None),
-                    getattr(forecast, 'end_time', None),
-                    getattr(forecast, 'duration', None),
-                    str(forecast.channel_type),
-                    forecast.per_kwh,
-                    forecast.spot_per_kwh,
-                    forecast.renewables,
-                    str(getattr(forecast, 'spike_status', None)) if getattr(forecast, 'spike_status', None) else None,
-                    str(getattr(forecast, 'descriptor', None)) if getattr(forecast, 'descriptor', None) else None,
-                    getattr(forecast, 'estimate', False),
-                    forecast_type,
-                    range_low,
-                    range_high,
-                    advanced_low,
-                    advanced_predicted,
-                    advanced_high,
-                    forecast_generated_at,
-                    getattr(forecast, 'var_date', None)
-                ))
+        rows = []
+        for forecast in forecast_data:
+            # Extract forecast-specific fields
+            forecast_type = getattr(forecast, 'type', 'Unknown')
+            
+            # Extract range data if available
+            range_data = getattr(forecast, 'range', None)
+            range_low = getattr(range_data, 'low', None) if range_data else None
+            range_high = getattr(range_data, 'high', None) if range_data else None
+            
+            # Extract advanced price data if available
+            advanced_price = getattr(forecast, 'advanced_price', None)
+            advanced_low = getattr(advanced_price, 'low', None) if advanced_price else None
+            advanced_predicted = getattr(advanced_price, 'predicted', None) if advanced_price else None
+            advanced_high = getattr(advanced_price, 'high', None) if advanced_price else None
+            
+            rows.append((
+                site_id,
+                forecast.nem_time,
+                getattr(forecast, 'start_time', None),
+                getattr(forecast, 'end_time', None),
+                getattr(forecast, 'duration', None),
+                str(forecast.channel_type),
+                forecast.per_kwh,
+                forecast.spot_per_kwh,
+                forecast.renewables,
+                _optional_str(forecast, 'spike_status'),
+                _optional_str(forecast, 'descriptor'),
+                getattr(forecast, 'estimate', False),
+                forecast_type,
+                range_low,
+                range_high,
+                advanced_low,
+                advanced_predicted,
+                advanced_high,
+                forecast_generated_at,
+                getattr(forecast, 'var_date', None)
+            ))
+        
+        self._write_rows('price_forecasts', FORECAST_COLUMNS, FORECAST_ON_CONFLICT, _unique_rows(rows, (0, 1, 5, 18)))
+    
+    def _write_rows(self, table: str, columns: tuple, on_conflict: str, rows: List[tuple]) -> int:
+        """Upsert a batch in a single transaction, rolling back so a failure doesn't poison the connection."""
+        try:
+            with self.connection.cursor() as cursor:
+                written = self._upsert_rows(cursor, table, columns, on_conflict, rows)
+            
+            self.connection.commit()
+            return written
+        except Exception:
+            self.connection.rollback()
+            raise
+    
+    def _upsert_rows(self, cursor, table: str, columns: tuple, on_conflict: str, rows: List[tuple]) -> int:
+        """Upsert rows with multi-row INSERTs, or via COPY into a staging table for large batches.
+
+        Returns the number of rows inserted or updated.
+        """
+        column_list = ', '.join(columns)
+        
+        if len(rows) < COPY_THRESHOLD:
+            # One page per call so rowcount covers every statement, not just the last page
+            written = 0
+            for start in range(0, len(rows), BATCH_PAGE_SIZE):
+                execute_values(
+                    cursor,
+                    f"INSERT INTO {table} ({column_list}) VALUES %s {on_conflict}",
+                    rows[start:start + BATCH_PAGE_SIZE],
+                    page_size=BATCH_PAGE_SIZE
+                )
+                written += cursor.rowcount
+            return written
+        
+        # Backfill-sized batches are idempotent upserts that can simply be re-fetched,
+        # so don't wait on the WAL flush at commit for them
+        cursor.execute("SET LOCAL synchronous_commit TO OFF")
+        
+        # Stage with COPY (single parse, streamed tuples), then merge with the usual conflict handling
+        staging = f"{table}_staging"
+        cursor.execute(
+            f"CREATE TEMP TABLE {staging} ON COMMIT DROP AS "
+            f"SELECT {column_list} FROM {table} WITH NO DATA"
+        )
         
-        self.connection.commit()
+        buffer = io.StringIO()
+        # Quote everything except None so empty strings aren't loaded as NULL
+        csv.writer(buffer, quoting=csv.QUOTE_NOTNULL).writerows(rows)
+        buffer.seek(0)
+        cursor.copy_expert(f"COPY {staging} ({column_list}) FROM STDIN WITH (FORMAT CSV)", buffer)
+        
+        cursor.execute(f"INSERT INTO {table} ({column_list}) SELECT {column_list} FROM {staging} {on_conflict}")
+        return cursor.rowcount
     
     def cleanup_old_forecasts(self, older_than_hours: int = 48) -> int:
         """Remove forecast data older than specified hours."""
@@ -355,7 +450,7 @@ class DatabaseService:
         with self.connection.cursor() as cursor:
             cursor.execute("""
                 DELETE FROM price_forecasts 
-                WHERE forecast_generated_at < NOW() - INTERVAL '%s hours'
+                WHERE forecast_generated_at < NOW() - %s * INTERVAL '1 hour'
             """, (older_than_hours,))
             
             deleted_count = cursor.rowcount
@@ -364,6 +459,22 @@ class DatabaseService:
             logger.info(f"Cleaned up {deleted_count} old forecast records")
             return deleted_count
     
+    def refresh_daily_cost_summary(self) -> None:
+        """Refresh the daily cost materialized view used by the dashboard."""
+        if not self.connection:
+            raise RuntimeError("Database not connected")
+        
+        try:
+            with self.connection.cursor() as cursor:
+                # CONCURRENTLY keeps the view readable while it is rebuilt
+                cursor.execute("REFRESH MATERIALIZED VIEW CONCURRENTLY daily_cost_summary")
+            
+            self.connection.commit()
+            logger.info("Refreshed daily cost summary")
+        except Exception:
+            self.connection.rollback()
+            raise
+    
     def get_latest_forecast_timestamp(self) -> Optional[datetime]:
         """Get the timestamp of the most recent forecast generation."""
         if not self.connection:
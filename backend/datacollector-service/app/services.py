@@ -3,9 +3,12 @@ Business logic services for Amber-Home application.
 """
 
 import logging
+import threading
 import time
+from collections import deque
+from concurrent.futures import ThreadPoolExecutor
 from datetime import datetime, timedelta
-from typing import List, Optional
+from typing import Callable, Iterator, List, Optional, Tuple
 import sys
 import os
 sys.path.append(os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
@@ -21,6 +24,18 @@ class AmberService:
     
     def __init__(self):
         self.client: Optional[AmberClient] = None
+        self._request_lock = threading.Lock()
+        self._next_request_at = 0.0
+    
+    def _throttle(self) -> None:
+        """Space API requests at least API_REQUEST_INTERVAL_SECONDS apart, across threads."""
+        with self._request_lock:
+            now = time.monotonic()
+            wait = self._next_request_at - now
+            self._next_request_at = max(now, self._next_request_at) + Config.API_REQUEST_INTERVAL_SECONDS
+        
+        if wait > 0:
+            time.sleep(wait)
     
     def initialize(self) -> None:
         """Initialize Amber API client."""
@@ -46,6 +61,7 @@ class AmberService:
             raise RuntimeError("AmberService not initialized")
         
         try:
+            self._throttle()
             prices = self.client.get_price_history(site_id, start_date, end_date)
             logger.debug(f"Retrieved {len(prices)} price records for site {site_id}")
             return prices
@@ -59,6 +75,7 @@ class AmberService:
             raise RuntimeError("AmberService not initialized")
         
         try:
+            self._throttle()
             usage_data = self.client.get_usage_data(site_id, start_date, end_date)
             logger.debug(f"Retrieved {len(usage_data)} usage records for site {site_id}")
             return usage_data
@@ -99,6 +116,7 @@ class AmberService:
             raise RuntimeError("AmberService not initialized")
         
         try:
+            self._throttle()
             forecasts = self.client.get_forecast_data(site_id, hours_ahead)
             logger.debug(f"Retrieved {len(forecasts)} forecast price records for site {site_id}")
             return forecasts
@@ -126,57 +144,83 @@ class CollectionService:
             logger.error(f"Failed to collect sites: {e}")
             raise
     
+    @staticmethod
+    def _date_chunks(start_date: datetime, end_date: datetime, days: int = 7) -> List[Tuple[datetime, datetime]]:
+        """Split a date range into API-sized chunks (max 7 days each)."""
+        chunks = []
+        current_start = start_date
+        
+        while current_start < end_date:
+            current_end = min(current_start + timedelta(days=days), end_date)
+            chunks.append((current_start, current_end))
+            current_start = current_end
+        
+        return chunks
+    
+    @staticmethod
+    def _prefetch_chunks(fetch: Callable, site_id: str,
+                         chunks: List[Tuple[datetime, datetime]]) -> Iterator[Tuple[Tuple[datetime, datetime], List]]:
+        """
+        Yield (chunk, records) in order while later chunks download in the background.
+        
+        At most API_MAX_WORKERS requests are in flight; the caller writes each chunk
+        to the database on its own thread so the single connection is never shared.
+        """
+        pending = deque()
+        remaining = iter(chunks)
+        
+        with ThreadPoolExecutor(max_workers=Config.API_MAX_WORKERS) as executor:
+            for chunk in remaining:
+                pending.append((chunk, executor.submit(fetch, site_id, *chunk)))
+                if len(pending) >= Config.API_MAX_WORKERS:
+                    break
+            
+            while pending:
+                chunk, future = pending.popleft()
+                records = future.result()
+                
+                next_chunk = next(remaining, None)
+                if next_chunk is not None:
+                    pending.append((next_chunk, executor.submit(fetch, site_id, *next_chunk)))
+                
+                yield chunk, records
+    
     def collect_price_data(self, start_date: datetime, end_date: datetime) -> None:
         """Collect price data for all sites within date range."""
         if not self.sites:
             raise RuntimeError("Sites not collected yet")
         
+        chunks = self._date_chunks(start_date, end_date)
+        
         for site in self.sites:
             try:
-                current_start = start_date
-                
-                while current_start < end_date:
-                    current_end = min(current_start + timedelta(days=7), end_date)
-                    
-                    logger.info(f"Collecting prices for site {site.id} from {current_start.date()} to {current_end.date()}")
-                    
-                    prices = self.amber.get_price_history(site.id, current_start, current_end)
+                for (chunk_start, chunk_end), prices in self._prefetch_chunks(self.amber.get_price_history, site.id, chunks):
+                    logger.info(f"Collecting prices for site {site.id} from {chunk_start.date()} to {chunk_end.date()}")
                     self.db.insert_price_data(site.id, prices)
                     
-                    current_start = current_end
-                    
-                    # Rate limiting
-                    time.sleep(2)
-                    
             except Exception as e:
                 logger.error(f"Failed to collect price data for site {site.id}: {e}")
                 continue
     
-    def collect_usage_data(self, start_date: datetime, end_date: datetime) -> None:
-        """Collect usage data for all sites within date range."""
+    def collect_usage_data(self, start_date: datetime, end_date: datetime) -> int:
+        """Collect usage data for all sites within date range, returning the number of rows written."""
         if not self.sites:
             raise RuntimeError("Sites not collected yet")
         
+        chunks = self._date_chunks(start_date, end_date)
+        written = 0
+        
         for site in self.sites:
             try:
-                current_start = start_date
-                
-                while current_start < end_date:
-                    current_end = min(current_start + timedelta(days=7), end_date)
-                    
-                    logger.info(f"Collecting usage for site {site.id} from {current_start.date()} to {current_end.date()}")
-                    
-                    usage_data = self.amber.get_usage_data(site.id, current_start, current_end)
-                    self.db.insert_usage_data(site.id, usage_data)
-                    
-                    current_start = current_end
-                    
-                    # Rate limiting
-                    time.sleep(2)
+                for (chunk_start, chunk_end), usage_data in self._prefetch_chunks(self.amber.get_usage_data, site.id, chunks):
+                    logger.info(f"Collecting usage for site {site.id} from {chunk_start.date()} to {chunk_end.date()}")
+                    written += self.db.insert_usage_data(site.id, usage_data)
                     
             except Exception as e:
                 logger.error(f"Failed to collect usage data for site {site.id}: {e}")
                 continue
+        
+        return written
     
     def collect_price_data_from_date(self, start_date: datetime) -> None:
         """Collect price data from a specific date to now."""
@@ -201,8 +245,8 @@ class CollectionService:
         self.collect_price_data(start_date, end_date)
         logger.info("Price data collection completed")
     
-    def collect_usage_data_from_date(self, start_date: datetime) -> None:
-        """Collect usage data from a specific date to now."""
+    def collect_usage_data_from_date(self, start_date: datetime) -> int:
+        """Collect usage data from a specific date to now, returning the number of rows written."""
         from datetime import timezone
         from zoneinfo import ZoneInfo
         
@@ -223,8 +267,9 @@ class CollectionService:
             logger.warning(f"Usage start date {start_date} is in the future, using current date")
             start_date = end_date - timedelta(days=1)
         
-        self.collect_usage_data(start_date, end_date)
-        logger.info("Usage data collection completed")
+        written = self.collect_usage_data(start_date, end_date)
+        logger.info(f"Usage data collection completed ({written} rows written)")
+        return written
     
     def collect_historical_data(self) -> None:
         """Collect all historical data from configured start date plus initial forecasts."""
@@ -232,7 +277,8 @@ class CollectionService:
         logger.info(f"Collecting all historical data from {start_date}")
         
         self.collect_price_data_from_date(start_date)
-        self.collect_usage_data_from_date(start_date)
+        if self.collect_usage_data_from_date(start_date):
+            self.refresh_cost_summary()
         
         # Collect initial forecast data
         if Config.COLLECT_FORECASTS:
@@ -281,7 +327,10 @@ class CollectionService:
             usage_start_date = Config.get_historical_start_date()
             logger.info(f"No existing usage data found, collecting from configured start date {usage_start_date}")
         
-        self.collect_usage_data_from_date(usage_start_date)
+        # Usage lands about a day late, so most cycles write nothing and the
+        # full re-aggregation behind the refresh can be skipped
+        if self.collect_usage_data_from_date(usage_start_date):
+            self.refresh_cost_summary()
         
         # Always collect fresh forecast data (default enabled)
         if Config.COLLECT_FORECASTS:
@@ -296,6 +345,14 @@ class CollectionService:
         
         logger.info("Latest data update completed (historical + forecasts)")
     
+    def refresh_cost_summary(self) -> None:
+        """Refresh precomputed daily cost aggregates after new usage data."""
+        try:
+            self.db.refresh_daily_cost_summary()
+        except Exception as e:
+            logger.error(f"Failed to refresh daily cost summary: {e}")
+            # Don't fail the update if the rollup refresh fails
+    
     def collect_forecast_data(self) -> None:
         """Collect forecast price data for all sites."""
         if not self.sites:
@@ -325,9 +382,6 @@ class CollectionService:
                 else:
                     logger.warning(f"No forecast data available for site {site.id}")
                 
-                # Rate limiting
-                time.sleep(2)
-                
             except Exception as e:
                 logger.error(f"Failed to collect forecast data for site {site.id}: {e}")
                 continue
@@ -85,7 +85,9 @@ CREATE TABLE IF NOT EXISTS tariff_information (
 );
 
 -- Indexes for performance
-CREATE INDEX IF NOT EXISTS idx_price_data_nem_time ON price_data(nem_time);
+-- Covers the dashboard's intraday price window so it can be answered by an index-only scan,
+-- and supersedes the plain nem_time index (ensure_schema drops that once this one exists)
+CREATE INDEX IF NOT EXISTS idx_price_data_nem_time_covering ON price_data(nem_time) INCLUDE (channel_type, per_kwh);
 CREATE INDEX IF NOT EXISTS idx_price_data_site_channel ON price_data(site_id, channel_type);
 CREATE INDEX IF NOT EXISTS idx_usage_data_nem_time ON usage_data(nem_time);
 CREATE INDEX IF NOT EXISTS idx_usage_data_site_channel ON usage_data(site_id, channel_type);
@@ -93,5 +95,23 @@ CREATE INDEX IF NOT EXISTS idx_usage_data_site_channel ON usage_data(site_id, ch
 -- Indexes for forecast data
 CREATE INDEX IF NOT EXISTS idx_price_forecasts_nem_time ON price_forecasts(nem_time);
 CREATE INDEX IF NOT EXISTS idx_price_forecasts_site_channel ON price_forecasts(site_id, channel_type);
-CREATE INDEX IF NOT EXISTS idx_price_forecasts_generated_at ON price_forecasts(forecast_generated_at);
-CREATE INDEX IF NOT EXISTS idx_price_forecasts_type ON price_forecasts(forecast_type);
\ No newline at end of file
+-- Serves MAX(forecast_generated_at) and the latest-run lookup, and supersedes the plain
+-- forecast_generated_at index (ensure_schema drops that once this one exists)
+CREATE INDEX IF NOT EXISTS idx_price_forecasts_generated_nem_time ON price_forecasts(forecast_generated_at DESC, nem_time);
+CREATE INDEX IF NOT EXISTS idx_price_forecasts_type ON price_forecasts(forecast_type);
+
+-- Daily cost rollup for the dashboard, refreshed by the collector after each usage update
+CREATE MATERIALIZED VIEW IF NOT EXISTS daily_cost_summary AS
+SELECT 
+    DATE(nem_time AT TIME ZONE 'Australia/Sydney') as date,
+    COALESCE(SUM(cost/100) FILTER (WHERE cost > 0), 0) as daily_cost_import,
+    COALESCE(SUM(-cost/100) FILTER (WHERE cost < 0), 0) as daily_cost_export,
+    SUM(cost/100) as daily_cost_net,
+    COALESCE(SUM(kwh) FILTER (WHERE kwh > 0), 0) as daily_kwh_import,
+    COALESCE(SUM(-kwh) FILTER (WHERE kwh < 0), 0) as daily_kwh_export,
+    COUNT(*) as record_count
+FROM usage_data
+GROUP BY DATE(nem_time AT TIME ZONE 'Australia/Sydney');
+
+-- Unique index required for REFRESH MATERIALIZED VIEW CONCURRENTLY
+CREATE UNIQUE INDEX IF NOT EXISTS idx_daily_cost_summary_date ON daily_cost_summary(date);
\ No newline at end of file
@@ -1,69 +1,56 @@
 import { NextResponse } from 'next/server';
-import { Pool } from 'pg';
+import { pool } from '@/lib/db';
+import { cached, cachedJsonResponse, secondsUntilNextBucket } from '@/lib/cache';
 
-const pool = new Pool({
-  connectionString: process.env.DATABASE_URL,
-  ssl: process.env.NODE_ENV === 'production' ? { rejectUnauthorized: false } : false
-});
+// Historical data query (only the columns the chart and summary use)
+const historicalQuery = `
+  SELECT 
+      nem_time AT TIME ZONE 'Australia/Sydney' as aest_time,
+      channel_type,
+      per_kwh
+  FROM price_data 
+  WHERE nem_time >= 
+        date_trunc('day', NOW() AT TIME ZONE 'Australia/Sydney') AT TIME ZONE 'Australia/Sydney'
+    AND nem_time <= NOW()
+  ORDER BY nem_time ASC
+`;
 
-export async function GET() {
-  try {
-    // Historical data query
-    const historicalQuery = `
-      SELECT 
-          nem_time AT TIME ZONE 'Australia/Sydney' as aest_time,
-          channel_type,
-          per_kwh,
-          spot_per_kwh,
-          renewables,
-          descriptor,
-          spike_status
-      FROM price_data 
-      WHERE nem_time AT TIME ZONE 'Australia/Sydney' >= 
-            (CURRENT_DATE AT TIME ZONE 'Australia/Sydney')::date
-        AND nem_time AT TIME ZONE 'Australia/Sydney' <= 
-            NOW() AT TIME ZONE 'Australia/Sydney'
-      ORDER BY nem_time ASC
-    `;
-
-    // Forecast data query
-    const forecastQuery = `
-      SELECT 
-          nem_time AT TIME ZONE 'Australia/Sydney' as aest_time,
-          channel_type,
-          per_kwh,
-          spot_per_kwh,
-          renewables,
-          descriptor,
-          spike_status,
-          forecast_type,
-          advanced_price_low,
-          advanced_price_predicted,
-          advanced_price_high,
-          range_low,
-          range_high
+// Forecast data query
+const forecastQuery = `
+  WITH latest AS (
+      SELECT MAX(forecast_generated_at) AS generated_at
       FROM price_forecasts 
-      WHERE nem_time AT TIME ZONE 'Australia/Sydney' > 
-            NOW() AT TIME ZONE 'Australia/Sydney'
-        AND nem_time AT TIME ZONE 'Australia/Sydney' <= 
-            NOW() AT TIME ZONE 'Australia/Sydney' + INTERVAL '10 hours'
-        AND forecast_generated_at = (
-            SELECT MAX(forecast_generated_at) 
-            FROM price_forecasts 
-            WHERE forecast_generated_at >= NOW() - INTERVAL '2 hours'
-        )
-      ORDER BY nem_time ASC
-    `;
+      WHERE forecast_generated_at >= NOW() - INTERVAL '2 hours'
+  )
+  SELECT 
+      nem_time AT TIME ZONE 'Australia/Sydney' as aest_time,
+      channel_type,
+      per_kwh,
+      advanced_price_low,
+      advanced_price_high
+  FROM price_forecasts 
+  JOIN latest ON price_forecasts.forecast_generated_at = latest.generated_at
+  WHERE nem_time > NOW()
+    AND nem_time <= NOW() + INTERVAL '10 hours'
+  ORDER BY nem_time ASC
+`;
 
-    const [historicalResult, forecastResult] = await Promise.all([
-      pool.query(historicalQuery),
-      pool.query(forecastQuery)
-    ]);
+export async function GET() {
+  try {
+    // Cache the encoded body so repeat hits in the bucket skip JSON serialization too
+    const body = await cached('combined-price-data', secondsUntilNextBucket(), async () => {
+      const [historicalResult, forecastResult] = await Promise.all([
+        pool.query({ name: 'combined-historical', text: historicalQuery }),
+        pool.query({ name: 'combined-forecast', text: forecastQuery })
+      ]);
 
-    return NextResponse.json({
-      historical: historicalResult.rows,
-      forecast: forecastResult.rows
+      return JSON.stringify({
+        historical: historicalResult.rows,
+        forecast: forecastResult.rows
+      });
     });
+
+    return cachedJsonResponse(body);
   } catch (error) {
     console.error('Error fetching combined price data:', error);
     return NextResponse.json({
@@ -1,63 +1,61 @@
 import { NextResponse } from 'next/server';
-import { Pool } from 'pg';
+import { unstable_cache } from 'next/cache';
+import { pool } from '@/lib/db';
+import { cachedJsonResponse, COST_STATS_TTL_SECONDS } from '@/lib/cache';
 
-const pool = new Pool({
-  connectionString: process.env.DATABASE_URL,
-  ssl: process.env.NODE_ENV === 'production' ? { rejectUnauthorized: false } : false
-});
+const LAST_7_DAYS = `date >= (CURRENT_DATE AT TIME ZONE 'Australia/Sydney')::date - INTERVAL '7 days'`;
 
-export async function GET() {
-  try {
-    const query = `
-      SELECT 
-          DATE(nem_time AT TIME ZONE 'Australia/Sydney') as date,
-          SUM(CASE WHEN cost > 0 THEN cost/100 ELSE 0 END) as daily_cost_import,
-          SUM(CASE WHEN cost < 0 THEN ABS(cost)/100 ELSE 0 END) as daily_cost_export,
-          SUM(cost/100) as daily_cost_net,
-          SUM(CASE WHEN kwh > 0 THEN kwh ELSE 0 END) as daily_kwh_import,
-          SUM(CASE WHEN kwh < 0 THEN ABS(kwh) ELSE 0 END) as daily_kwh_export,
-          COUNT(*) as record_count
-      FROM usage_data 
-      WHERE nem_time AT TIME ZONE 'Australia/Sydney' >= 
-            (CURRENT_DATE AT TIME ZONE 'Australia/Sydney')::date - INTERVAL '7 days'
-      GROUP BY DATE(nem_time AT TIME ZONE 'Australia/Sydney')
-      ORDER BY date DESC
-    `;
+const dailyQuery = `
+  SELECT 
+      date,
+      daily_cost_import,
+      daily_cost_export,
+      daily_cost_net,
+      daily_kwh_import,
+      daily_kwh_export
+  FROM daily_cost_summary 
+  WHERE ${LAST_7_DAYS}
+  ORDER BY date DESC
+`;
+
+// Totals come back as a single row so the route never re-walks the days
+const totalsQuery = `
+  SELECT 
+      COALESCE(SUM(daily_cost_net), 0) as total_cost,
+      COALESCE(AVG(daily_cost_net), 0) as avg_daily_cost,
+      COALESCE(SUM(daily_cost_import), 0) as total_import_cost,
+      COALESCE(SUM(daily_cost_export), 0) as total_export_cost,
+      COALESCE(SUM(daily_kwh_import), 0) as total_kwh_import,
+      COALESCE(SUM(daily_kwh_export), 0) as total_kwh_export,
+      COUNT(*)::int as days_with_data
+  FROM daily_cost_summary 
+  WHERE ${LAST_7_DAYS}
+`;
 
-    const result = await pool.query(query);
-    
-    if (result.rows.length === 0) {
-      return NextResponse.json({
-        total_cost: 0,
-        avg_daily_cost: 0,
-        total_import_cost: 0,
-        total_export_cost: 0,
-        total_kwh_import: 0,
-        total_kwh_export: 0,
-        days_with_data: 0,
-        daily_data: []
-      });
-    }
+// The weekly aggregates only move when the collector lands usage, so the encoded
+// body is kept in Next's data cache (.next/cache). That outlives a process
+// restart inside the same container, but a redeploy starts cold. It is the only
+// cache layer here: stacking the in-process cache on top of this
+// stale-while-revalidate entry would let results age past the TTL.
+const loadCostStats = unstable_cache(async () => {
+  const [dailyResult, totalsResult] = await Promise.all([
+    pool.query({ name: 'cost-stats-daily', text: dailyQuery }),
+    pool.query({ name: 'cost-stats-totals', text: totalsQuery })
+  ]);
 
-    const dailyData = result.rows;
-    const totalCost = dailyData.reduce((sum, day) => sum + parseFloat(day.daily_cost_net), 0);
-    const totalImportCost = dailyData.reduce((sum, day) => sum + parseFloat(day.daily_cost_import), 0);
-    const totalExportCost = dailyData.reduce((sum, day) => sum + parseFloat(day.daily_cost_export), 0);
-    const totalKwhImport = dailyData.reduce((sum, day) => sum + parseFloat(day.daily_kwh_import), 0);
-    const totalKwhExport = dailyData.reduce((sum, day) => sum + parseFloat(day.daily_kwh_export), 0);
+  return JSON.stringify({
+    ...totalsResult.rows[0],
+    daily_data: dailyResult.rows
+  });
+}, ['cost-stats'], { revalidate: COST_STATS_TTL_SECONDS });
+
+export async function GET() {
+  try {
+    const body = await loadCostStats();
 
-    return NextResponse.json({
-      total_cost: totalCost,
-      avg_daily_cost: totalCost / dailyData.length,
-      total_import_cost: totalImportCost,
-      total_export_cost: totalExportCost,
-      total_kwh_import: totalKwhImport,
-      total_kwh_export: totalKwhExport,
-      days_with_data: dailyData.length,
-      daily_data: dailyData
-    });
+    return cachedJsonResponse(body);
   } catch (error) {
     console.error('Error fetching cost stats:', error);
     return NextResponse.json({ error: 'Failed to fetch cost stats' }, { status: 500 });
   }
-}
\ No newline at end of file
+}
@@ -1,16 +1,17 @@
 'use client';
 
-import React, { useEffect, useState } from 'react';
+import React, { useEffect, useMemo, useState } from 'react';
 import CombinedPriceChart from '@/components/CombinedPriceChart';
 import { CombinedPriceData } from '@/lib/database';
+import { channelKind } from '@/lib/channels';
 
 export default function Home() {
   const [combinedPriceData, setCombinedPriceData] = useState<CombinedPriceData>({ historical: [], forecast: [] });
   const [loading, setLoading] = useState(true);
 
   const fetchData = async () => {
+    // Only the first load shows the loading screen; refreshes update the chart in place
     try {
-      setLoading(true);
       const combinedRes = await fetch('/api/combined-price-data');
 
       if (combinedRes.ok) {
@@ -31,24 +32,30 @@ export default function Home() {
     return () => clearInterval(interval);
   }, []);
 
-  const calculatePriceSummary = () => {
+  const priceSummary = useMemo(() => {
     if (!combinedPriceData.historical || combinedPriceData.historical.length === 0) return null;
 
-    const importData = combinedPriceData.historical.filter(item => item.channel_type?.includes('GENERAL'));
-    const exportData = combinedPriceData.historical.filter(item => item.channel_type?.includes('FEEDIN'));
+    // Walk back from the newest row until both channels have a current price
+    let currentImport: number | undefined;
+    let currentExport: number | undefined;
+    const historical = combinedPriceData.historical;
 
-    const currentImport = importData.length > 0 && importData[importData.length - 1]?.per_kwh !== undefined 
-      ? Number(importData[importData.length - 1].per_kwh) || 0 : 0;
-    const currentExport = exportData.length > 0 && exportData[exportData.length - 1]?.per_kwh !== undefined 
-      ? Number(exportData[exportData.length - 1].per_kwh) || 0 : 0;
+    for (let i = historical.length - 1; i >= 0; i--) {
+      if (currentImport !== undefined && currentExport !== undefined) break;
+
+      const kind = channelKind(historical[i].channel_type);
+      if (kind === 'import' && currentImport === undefined) {
+        currentImport = Number(historical[i].per_kwh) || 0;
+      } else if (kind === 'export' && currentExport === undefined) {
+        currentExport = Number(historical[i].per_kwh) || 0;
+      }
+    }
 
     return {
-      currentImport: Number(currentImport) || 0,
-      currentExport: Number(currentExport) || 0
+      currentImport: currentImport ?? 0,
+      currentExport: currentExport ?? 0
     };
-  };
-
-  const priceSummary = calculatePriceSummary();
+  }, [combinedPriceData]);
 
   if (loading) {
     return (
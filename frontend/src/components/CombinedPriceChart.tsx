@@ -1,40 +1,206 @@
 'use client';
 
 import React from 'react';
-import {
-  Chart as ChartJS,
-  CategoryScale,
-  LinearScale,
-  PointElement,
-  LineElement,
-  Title,
-  Tooltip,
-  Legend,
-  TimeScale,
-  Filler
-} from 'chart.js';
 import annotationPlugin from 'chartjs-plugin-annotation';
 import { Line } from 'react-chartjs-2';
-import 'chartjs-adapter-date-fns';
-import { CombinedPriceData } from '@/lib/database';
+import { ChartJS, decimation } from '@/lib/timeSeriesChart';
+import { ChartForecastData, ChartPriceData, CombinedPriceData } from '@/lib/database';
+import { splitByChannel } from '@/lib/channels';
 
-ChartJS.register(
-  CategoryScale,
-  LinearScale,
-  PointElement,
-  LineElement,
-  Title,
-  Tooltip,
-  Legend,
-  TimeScale,
-  Filler,
-  annotationPlugin
-);
+ChartJS.register(annotationPlugin);
 
 interface CombinedPriceChartProps {
   data: CombinedPriceData;
 }
 
+interface PricePoint {
+  x: number;
+  y: number | null;
+}
+
+interface ForecastSeries {
+  price: PricePoint[];
+  high: PricePoint[];
+  low: PricePoint[];
+  hasBand: boolean;
+}
+
+// Points are built in Chart.js's internal format (epoch-ms x, numeric y) so the
+// chart can run with parsing disabled instead of re-parsing every update.
+function toPricePoints(rows: ChartPriceData[], sign: number): PricePoint[] {
+  const points = new Array<PricePoint>(rows.length);
+  for (let i = 0; i < rows.length; i++) {
+    points[i] = { x: Date.parse(rows[i].aest_time), y: Number(rows[i].per_kwh) * sign };
+  }
+  return points;
+}
+
+// Build the price line and both band edges in a single pass over the forecast rows.
+function toForecastSeries(rows: ChartForecastData[], sign: number): ForecastSeries {
+  const price = new Array<PricePoint>(rows.length);
+  const high = new Array<PricePoint>(rows.length);
+  const low = new Array<PricePoint>(rows.length);
+  let hasBand = false;
+
+  for (let i = 0; i < rows.length; i++) {
+    const item = rows[i];
+    const x = Date.parse(item.aest_time);
+    price[i] = { x, y: Number(item.per_kwh) * sign };
+    high[i] = { x, y: bandValue(item.advanced_price_high, sign) };
+    low[i] = { x, y: bandValue(item.advanced_price_low, sign) };
+    if (item.advanced_price_high && item.advanced_price_low) {
+      hasBand = true;
+    }
+  }
+
+  return { price, high, low, hasBand };
+}
+
+function bandValue(value: number | null | undefined, sign: number): number | null {
+  // Missing import bounds leave a gap; missing export bounds sit on the axis
+  if (value === null || value === undefined) {
+    return sign < 0 ? 0 : null;
+  }
+  return Number(value) * sign;
+}
+
+// Layout, scales and plugin config never change between refreshes, so keep a
+// single instance and let react-chartjs-2 update only the datasets in place.
+const chartOptions = {
+  responsive: true,
+  parsing: false as const,
+  normalized: true,
+  // Draw each refresh once rather than over an animation's worth of frames
+  animation: false as const,
+  plugins: {
+    decimation,
+    // Add background zones for price brackets
+    annotation: {
+      annotations: {
+        greenZone: {
+          type: 'box',
+          yMin: 0,
+          yMax: 20,
+          backgroundColor: 'rgba(34, 197, 94, 0.2)', // Green - good prices
+          borderWidth: 0,
+        },
+        yellowGreenZone: {
+          type: 'box',
+          yMin: 20,
+          yMax: 30,
+          backgroundColor: 'rgba(132, 204, 22, 0.2)', // Yellow-green transition
+          borderWidth: 0,
+        },
+        yellowZone: {
+          type: 'box', 
+          yMin: 30,
+          yMax: 40,
+          backgroundColor: 'rgba(234, 179, 8, 0.2)', // Yellow - moderate prices
+          borderWidth: 0,
+        },
+        orangeZone: {
+          type: 'box',
+          yMin: 40,
+          yMax: 50,
+          backgroundColor: 'rgba(249, 115, 22, 0.2)', // Orange - higher prices
+          borderWidth: 0,
+        },
+        redOrangeZone: {
+          type: 'box',
+          yMin: 50,
+          yMax: 60,
+          backgroundColor: 'rgba(255, 87, 51, 0.2)', // Red-orange transition
+          borderWidth: 0,
+        },
+        redZone: {
+          type: 'box',
+          yMin: 60,
+          yMax: 70,
+          backgroundColor: 'rgba(239, 68, 68, 0.2)', // Red - expensive prices
+          borderWidth: 0,
+        },
+        darkRedZone: {
+          type: 'box',
+          yMin: 70,
+          yMax: 80,
+          backgroundColor: 'rgba(220, 38, 38, 0.2)', // Dark red - very expensive
+          borderWidth: 0,
+        },
+        veryDarkRedZone: {
+          type: 'box',
+          yMin: 80,
+          yMax: 100,
+          backgroundColor: 'rgba(185, 28, 28, 0.2)', // Very dark red - extremely expensive
+          borderWidth: 0,
+        }
+      }
+    },
+    legend: {
+      position: 'top' as const,
+      labels: {
+        filter: function(legendItem: any) {
+          // Hide high bounds from legend, keep uncertainty bands
+          return legendItem.text !== 'Import High' && legendItem.text !== 'Export High';
+        }
+      }
+    },
+    title: {
+      display: true,
+      text: 'Electricity Prices - Historical + 10h Forecasts',
+      font: {
+        size: 20,
+        color: '#2c3e50'
+      }
+    },
+    tooltip: {
+      callbacks: {
+        label: function(context: any) {
+          return `${context.dataset.label}: ${context.parsed.y.toFixed(2)}¢/kWh`;
+        }
+      }
+    }
+  },
+  scales: {
+    x: {
+      type: 'time' as const,
+      time: {
+        displayFormats: {
+          hour: 'HH:mm',
+          day: 'MM/dd'
+        }
+      },
+      title: {
+        display: true,
+        text: 'Time (AEST)'
+      }
+    },
+    y: {
+      title: {
+        display: true,
+        text: 'Price (¢/kWh)'
+      },
+      ticks: {
+        stepSize: 10,
+        callback: function(value: any) {
+          return value + '¢';
+        }
+      },
+      grid: {
+        color: function(context: any) {
+          return '#374151';
+        },
+        lineWidth: function(context: any) {
+          if (context.tick.value === 0 || context.tick.value === 10 || context.tick.value === 20) {
+            return 2; // Thicker lines for key values
+          }
+          return 1; // Default line width
+        }
+      }
+    }
+  },
+  maintainAspectRatio: false
+};
+
 export default function CombinedPriceChart({ data }: CombinedPriceChartProps) {
   if ((!data.historical || data.historical.length === 0) && (!data.forecast || data.forecast.length === 0)) {
     return (
@@ -48,22 +214,19 @@ export default function CombinedPriceChart({ data }: CombinedPriceChartProps) {
 
   // Historical data
   if (data.historical && data.historical.length > 0) {
-    const historicalImport = data.historical.filter(item => item.channel_type.includes('GENERAL'));
-    const historicalExport = data.historical.filter(item => item.channel_type.includes('FEEDIN'));
+    const { importRows: historicalImport, exportRows: historicalExport } = splitByChannel(data.historical);
 
     if (historicalImport.length > 0) {
       datasets.push({
         label: 'Historical Import',
-        data: historicalImport.map(item => ({
-          x: item.aest_time,
-          y: item.per_kwh
-        })),
+        data: toPricePoints(historicalImport, 1),
         borderColor: '#ff6b6b',
         backgroundColor: '#ff6b6b',
         tension: 0.1,
         pointRadius: 0,
         pointHoverRadius: 6,
         pointHitRadius: 10,
+        spanGaps: true,
         borderWidth: 3,
       });
     }
@@ -71,16 +234,14 @@ export default function CombinedPriceChart({ data }: CombinedPriceChartProps) {
     if (historicalExport.length > 0) {
       datasets.push({
         label: 'Historical Export',
-        data: historicalExport.map(item => ({
-          x: item.aest_time,
-          y: item.per_kwh * -1
-        })),
+        data: toPricePoints(historicalExport, -1),
         borderColor: '#4ecdc4',
         backgroundColor: '#4ecdc4',
         tension: 0.1,
         pointRadius: 0,
         pointHoverRadius: 6,
         pointHitRadius: 10,
+        spanGaps: true,
         borderWidth: 3,
       });
     }
@@ -88,16 +249,14 @@ export default function CombinedPriceChart({ data }: CombinedPriceChartProps) {
 
   // Forecast data
   if (data.forecast && data.forecast.length > 0) {
-    const forecastImport = data.forecast.filter(item => item.channel_type.includes('GENERAL'));
-    const forecastExport = data.forecast.filter(item => item.channel_type.includes('FEEDIN'));
+    const { importRows: forecastImport, exportRows: forecastExport } = splitByChannel(data.forecast);
 
     if (forecastImport.length > 0) {
+      const series = toForecastSeries(forecastImport, 1);
+
       datasets.push({
         label: 'Forecast Import',
-        data: forecastImport.map(item => ({
-          x: item.aest_time,
-          y: item.per_kwh
-        })),
+        data: series.price,
         borderColor: '#ff6b6b',
         backgroundColor: '#ff6b6b',
         borderDash: [5, 5],
@@ -105,17 +264,15 @@ export default function CombinedPriceChart({ data }: CombinedPriceChartProps) {
         pointRadius: 0,
         pointHoverRadius: 6,
         pointHitRadius: 10,
+        spanGaps: true,
       });
 
       // Add uncertainty bands if available
-      if (forecastImport.some(item => item.advanced_price_high && item.advanced_price_low)) {
+      if (series.hasBand) {
         // Add high bound (invisible line for fill reference)
         datasets.push({
           label: 'Import High',
-          data: forecastImport.map(item => ({
-            x: item.aest_time,
-            y: item.advanced_price_high
-          })),
+          data: series.high,
           borderColor: 'rgba(255, 107, 107, 0)',
           backgroundColor: 'rgba(255, 107, 107, 0)',
           fill: false,
@@ -125,10 +282,7 @@ export default function CombinedPriceChart({ data }: CombinedPriceChartProps) {
         // Add uncertainty band (fills between high and low)
         datasets.push({
           label: 'Import Uncertainty',
-          data: forecastImport.map(item => ({
-            x: item.aest_time,
-            y: item.advanced_price_low
-          })),
+          data: series.low,
           borderColor: 'rgba(255, 107, 107, 0)',
           backgroundColor: 'rgba(255, 107, 107, 0.2)',
           fill: '-1',
@@ -138,12 +292,11 @@ export default function CombinedPriceChart({ data }: CombinedPriceChartProps) {
     }
 
     if (forecastExport.length > 0) {
+      const series = toForecastSeries(forecastExport, -1);
+
       datasets.push({
         label: 'Forecast Export',
-        data: forecastExport.map(item => ({
-          x: item.aest_time,
-          y: item.per_kwh * -1
-        })),
+        data: series.price,
         borderColor: '#4ecdc4',
         backgroundColor: '#4ecdc4',
         borderDash: [5, 5],
@@ -151,17 +304,15 @@ export default function CombinedPriceChart({ data }: CombinedPriceChartProps) {
         pointRadius: 0,
         pointHoverRadius: 6,
         pointHitRadius: 10,
+        spanGaps: true,
       });
 
       // Add uncertainty bands if available
-      if (forecastExport.some(item => item.advanced_price_high && item.advanced_price_low)) {
+      if (series.hasBand) {
         // Add high bound (invisible line for fill reference)
         datasets.push({
           label: 'Export High',
-          data: forecastExport.map(item => ({
-            x: item.aest_time,
-            y: (item.advanced_price_high || 0) * -1
-          })),
+          data: series.high,
           borderColor: 'rgba(78, 205, 196, 0)',
           backgroundColor: 'rgba(78, 205, 196, 0)',
           fill: false,
@@ -171,10 +322,7 @@ export default function CombinedPriceChart({ data }: CombinedPriceChartProps) {
         // Add uncertainty band (fills between high and low)
         datasets.push({
           label: 'Export Uncertainty',
-          data: forecastExport.map(item => ({
-            x: item.aest_time,
-            y: (item.advanced_price_low || 0) * -1
-          })),
+          data: series.low,
           borderColor: 'rgba(78, 205, 196, 0)',
           backgroundColor: 'rgba(78, 205, 196, 0.2)',
           fill: '-1',
@@ -186,139 +334,9 @@ export default function CombinedPriceChart({ data }: CombinedPriceChartProps) {
 
   const chartData = { datasets };
 
-  const options = {
-    responsive: true,
-    plugins: {
-      // Add background zones for price brackets
-      annotation: {
-        annotations: {
-          greenZone: {
-            type: 'box',
-            yMin: 0,
-            yMax: 20,
-            backgroundColor: 'rgba(34, 197, 94, 0.2)', // Green - good prices
-            borderWidth: 0,
-          },
-          yellowGreenZone: {
-            type: 'box',
-            yMin: 20,
-            yMax: 30,
-            backgroundColor: 'rgba(132, 204, 22, 0.2)', // Yellow-green transition
-            borderWidth: 0,
-          },
-          yellowZone: {
-            type: 'box', 
-            yMin: 30,
-            yMax: 40,
-            backgroundColor: 'rgba(234, 179, 8, 0.2)', // Yellow - moderate prices
-            borderWidth: 0,
-          },
-          orangeZone: {
-            type: 'box',
-            yMin: 40,
-            yMax: 50,
-            backgroundColor: 'rgba(249, 115, 22, 0.2)', // Orange - higher prices
-            borderWidth: 0,
-          },
-          redOrangeZone: {
-            type: 'box',
-            yMin: 50,
-            yMax: 60,
-            backgroundColor: 'rgba(255, 87, 51, 0.2)', // Red-orange transition
-            borderWidth: 0,
-          },
-          redZone: {
-            type: 'box',
-            yMin: 60,
-            yMax: 70,
-            backgroundColor: 'rgba(239, 68, 68, 0.2)', // Red - expensive prices
-            borderWidth: 0,
-          },
-          darkRedZone: {
-            type: 'box',
-            yMin: 70,
-            yMax: 80,
-            backgroundColor: 'rgba(220, 38, 38, 0.2)', // Dark red - very expensive
-            borderWidth: 0,
-          },
-          veryDarkRedZone: {
-            type: 'box',
-            yMin: 80,
-            yMax: 100,
-            backgroundColor: 'rgba(185, 28, 28, 0.2)', // Very dark red - extremely expensive
-            borderWidth: 0,
-          }
-        }
-      },
-      legend: {
-        position: 'top' as const,
-        labels: {
-          filter: function(legendItem: any) {
-            // Hide high bounds from legend, keep uncertainty bands
-            return legendItem.text !== 'Import High' && legendItem.text !== 'Export High';
-          }
-        }
-      },
-      title: {
-        display: true,
-        text: 'Electricity Prices - Historical + 10h Forecasts',
-        font: {
-          size: 20,
-          color: '#2c3e50'
-        }
-      },
-      tooltip: {
-        callbacks: {
-          label: function(context: any) {
-            return `${context.dataset.label}: ${context.parsed.y.toFixed(2)}¢/kWh`;
-          }
-        }
-      }
-    },
-    scales: {
-      x: {
-        type: 'time' as const,
-        time: {
-          displayFormats: {
-            hour: 'HH:mm',
-            day: 'MM/dd'
-          }
-        },
-        title: {
-          display: true,
-          text: 'Time (AEST)'
-        }
-      },
-      y: {
-        title: {
-          display: true,
-          text: 'Price (¢/kWh)'
-        },
-        ticks: {
-          stepSize: 10,
-          callback: function(value: any) {
-            return value + '¢';
-          }
-        },
-        grid: {
-          color: function(context: any) {
-            return '#374151';
-          },
-          lineWidth: function(context: any) {
-            if (context.tick.value === 0 || context.tick.value === 10 || context.tick.value === 20) {
-              return 2; // Thicker lines for key values
-            }
-            return 1; // Default line width
-          }
-        }
-      }
-    },
-    maintainAspectRatio: false
-  };
-
   return (
     <div className="h-96">
-      <Line data={chartData} options={options} />
+      <Line data={chartData} options={chartOptions} />
     </div>
   );
 }
\ No newline at end of file
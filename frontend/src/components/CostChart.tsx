@@ -40,7 +40,25 @@ export default function CostChart({ data, type }: CostChartProps) {
     );
   }
 
-  const labels = data.daily_data.map(item => item.date);
+  // Fill every column in one pass over the days instead of one map per dataset
+  const days = data.daily_data;
+  const labels = new Array<string>(days.length);
+  const importValues = new Array<number>(days.length);
+  const exportValues = new Array<number>(days.length);
+  const netValues = new Array<number>(days.length);
+
+  for (let i = 0; i < days.length; i++) {
+    const day = days[i];
+    labels[i] = day.date;
+    if (type === 'cost') {
+      importValues[i] = day.daily_cost_import;
+      exportValues[i] = -day.daily_cost_export;
+      netValues[i] = day.daily_cost_net;
+    } else {
+      importValues[i] = day.daily_kwh_import;
+      exportValues[i] = -day.daily_kwh_export;
+    }
+  }
 
   const chartData = type === 'cost' ? {
     labels,
@@ -48,21 +66,21 @@ export default function CostChart({ data, type }: CostChartProps) {
       {
         type: 'bar' as const,
         label: 'Import Cost',
-        data: data.daily_data.map(item => item.daily_cost_import),
+        data: importValues,
         backgroundColor: '#ff6b6b',
         borderColor: '#ff6b6b',
       },
       {
         type: 'bar' as const,
         label: 'Export Credit',
-        data: data.daily_data.map(item => -item.daily_cost_export),
+        data: exportValues,
         backgroundColor: '#4ecdc4',
         borderColor: '#4ecdc4',
       },
       {
         type: 'line' as const,
         label: 'Net Cost',
-        data: data.daily_data.map(item => item.daily_cost_net),
+        data: netValues,
         borderColor: '#2c3e50',
         backgroundColor: '#2c3e50',
         borderWidth: 3,
@@ -76,14 +94,14 @@ export default function CostChart({ data, type }: CostChartProps) {
       {
         type: 'bar' as const,
         label: 'Import (kWh)',
-        data: data.daily_data.map(item => item.daily_kwh_import),
+        data: importValues,
         backgroundColor: '#ff6b6b',
         borderColor: '#ff6b6b',
       },
       {
         type: 'bar' as const,
         label: 'Export (kWh)',
-        data: data.daily_data.map(item => -item.daily_kwh_export),
+        data: exportValues,
         backgroundColor: '#4ecdc4',
         borderColor: '#4ecdc4',
       },
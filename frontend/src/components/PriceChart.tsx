@@ -1,38 +1,66 @@
 'use client';
 
 import React from 'react';
-import {
-  Chart as ChartJS,
-  CategoryScale,
-  LinearScale,
-  PointElement,
-  LineElement,
-  Title,
-  Tooltip,
-  Legend,
-  TimeScale,
-  Filler
-} from 'chart.js';
 import { Line } from 'react-chartjs-2';
-import 'chartjs-adapter-date-fns';
+import { decimation } from '@/lib/timeSeriesChart';
 import { PriceData } from '@/lib/database';
-
-ChartJS.register(
-  CategoryScale,
-  LinearScale,
-  PointElement,
-  LineElement,
-  Title,
-  Tooltip,
-  Legend,
-  TimeScale,
-  Filler
-);
+import { splitByChannel } from '@/lib/channels';
 
 interface PriceChartProps {
   data: PriceData[];
 }
 
+// Static chart configuration shared by every render
+const chartOptions = {
+  responsive: true,
+  parsing: false as const,
+  normalized: true,
+  animation: false as const,
+  plugins: {
+    decimation,
+    legend: {
+      position: 'top' as const,
+    },
+    title: {
+      display: true,
+      text: 'Electricity Prices - Past 24 Hours',
+      font: {
+        size: 20,
+        color: '#2c3e50'
+      }
+    },
+    tooltip: {
+      callbacks: {
+        label: function(context: any) {
+          return `${context.dataset.label}: ${context.parsed.y.toFixed(2)}¢/kWh`;
+        }
+      }
+    }
+  },
+  scales: {
+    x: {
+      type: 'time' as const,
+      time: {
+        displayFormats: {
+          hour: 'HH:mm',
+          day: 'MM/dd'
+        }
+      },
+      title: {
+        display: true,
+        text: 'Time (AEST)'
+      }
+    },
+    y: {
+      title: {
+        display: true,
+        text: 'Price (¢/kWh)'
+      }
+    }
+  },
+  maintainAspectRatio: false
+};
+
 export default function PriceChart({ data }: PriceChartProps) {
   if (!data || data.length === 0) {
     return (
@@ -43,83 +71,38 @@ export default function PriceChart({ data }: PriceChartProps) {
   }
 
   // Separate import and export data
-  const importData = data.filter(item => item.channel_type.includes('GENERAL'));
-  const exportData = data.filter(item => item.channel_type.includes('FEEDIN'));
+  const { importRows: importData, exportRows: exportData } = splitByChannel(data);
 
   const chartData = {
     datasets: [
       {
         label: 'Import Price (E1)',
         data: importData.map(item => ({
-          x: item.aest_time,
-          y: item.per_kwh
+          x: Date.parse(item.aest_time),
+          y: Number(item.per_kwh)
         })),
         borderColor: '#ff6b6b',
         backgroundColor: '#ff6b6b',
         tension: 0.1,
+        spanGaps: true,
       },
       {
         label: 'Export Price (B1)',
         data: exportData.map(item => ({
-          x: item.aest_time,
-          y: item.per_kwh
+          x: Date.parse(item.aest_time),
+          y: Number(item.per_kwh)
         })),
         borderColor: '#4ecdc4',
         backgroundColor: '#4ecdc4',
         tension: 0.1,
+        spanGaps: true,
       },
     ],
   };
 
-  const options = {
-    responsive: true,
-    plugins: {
-      legend: {
-        position: 'top' as const,
-      },
-      title: {
-        display: true,
-        text: 'Electricity Prices - Past 24 Hours',
-        font: {
-          size: 20,
-          color: '#2c3e50'
-        }
-      },
-      tooltip: {
-        callbacks: {
-          label: function(context: any) {
-            return `${context.dataset.label}: ${context.parsed.y.toFixed(2)}¢/kWh`;
-          }
-        }
-      }
-    },
-    scales: {
-      x: {
-        type: 'time' as const,
-        time: {
-          displayFormats: {
-            hour: 'HH:mm',
-            day: 'MM/dd'
-          }
-        },
-        title: {
-          display: true,
-          text: 'Time (AEST)'
-        }
-      },
-      y: {
-        title: {
-          display: true,
-          text: 'Price (¢/kWh)'
-        }
-      }
-    },
-    maintainAspectRatio: false
-  };
-
   return (
     <div className="h-96">
-      <Line data={chartData} options={options} />
+      <Line data={chartData} options={chartOptions} />
     </div>
   );
 }
\ No newline at end of file
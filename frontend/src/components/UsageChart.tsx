@@ -1,38 +1,66 @@
 'use client';
 
 import React from 'react';
-import {
-  Chart as ChartJS,
-  CategoryScale,
-  LinearScale,
-  PointElement,
-  LineElement,
-  Title,
-  Tooltip,
-  Legend,
-  TimeScale,
-  Filler
-} from 'chart.js';
 import { Line } from 'react-chartjs-2';
-import 'chartjs-adapter-date-fns';
+import { decimation } from '@/lib/timeSeriesChart';
 import { UsageData } from '@/lib/database';
 
-ChartJS.register(
-  CategoryScale,
-  LinearScale,
-  PointElement,
-  LineElement,
-  Title,
-  Tooltip,
-  Legend,
-  TimeScale,
-  Filler
-);
-
 interface UsageChartProps {
   data: UsageData[];
 }
 
+// Options are static; only the datasets change between renders
+const chartOptions = {
+  responsive: true,
+  // Points are already epoch-ms/number pairs
+  parsing: false as const,
+  normalized: true,
+  animation: false as const,
+  plugins: {
+    decimation,
+    legend: {
+      position: 'top' as const,
+    },
+    title: {
+      display: true,
+      text: 'Energy Usage - Past 24 Hours',
+      font: {
+        size: 20,
+        color: '#2c3e50'
+      }
+    },
+    tooltip: {
+      callbacks: {
+        label: function(context: any) {
+          return `${context.dataset.label}: ${context.parsed.y.toFixed(3)} kWh`;
+        }
+      }
+    }
+  },
+  scales: {
+    x: {
+      type: 'time' as const,
+      time: {
+        displayFormats: {
+          hour: 'HH:mm',
+          day: 'MM/dd'
+        }
+      },
+      title: {
+        display: true,
+        text: 'Time (AEST)'
+      }
+    },
+    y: {
+      title: {
+        display: true,
+        text: 'Usage (kWh)'
+      }
+    }
+  },
+  maintainAspectRatio: false
+};
+
 export default function UsageChart({ data }: UsageChartProps) {
   if (!data || data.length === 0) {
     return (
@@ -42,86 +70,45 @@ export default function UsageChart({ data }: UsageChartProps) {
     );
   }
 
-  // Separate import and export data
-  const importData = data.filter(item => item.kwh > 0);
-  const exportData = data.filter(item => item.kwh < 0);
+  // Separate import and export points in one pass by the sign of kwh
+  const importPoints: { x: number; y: number }[] = [];
+  const exportPoints: { x: number; y: number }[] = [];
+
+  for (const item of data) {
+    const kwh = Number(item.kwh);
+    if (kwh > 0) {
+      importPoints.push({ x: Date.parse(item.aest_time), y: kwh });
+    } else if (kwh < 0) {
+      exportPoints.push({ x: Date.parse(item.aest_time), y: kwh });
+    }
+  }
 
   const chartData = {
     datasets: [
       {
         label: 'Import Usage (E1)',
-        data: importData.map(item => ({
-          x: item.aest_time,
-          y: item.kwh
-        })),
+        data: importPoints,
         borderColor: '#ff6b6b',
         backgroundColor: 'rgba(255, 107, 107, 0.3)',
         fill: 'origin',
         tension: 0.1,
+        spanGaps: true,
       },
       {
         label: 'Export Usage (B1)',
-        data: exportData.map(item => ({
-          x: item.aest_time,
-          y: item.kwh
-        })),
+        data: exportPoints,
         borderColor: '#4ecdc4',
         backgroundColor: 'rgba(78, 205, 196, 0.3)',
         fill: 'origin',
         tension: 0.1,
+        spanGaps: true,
       },
     ],
   };
 
-  const options = {
-    responsive: true,
-    plugins: {
-      legend: {
-        position: 'top' as const,
-      },
-      title: {
-        display: true,
-        text: 'Energy Usage - Past 24 Hours',
-        font: {
-          size: 20,
-          color: '#2c3e50'
-        }
-      },
-      tooltip: {
-        callbacks: {
-          label: function(context: any) {
-            return `${context.dataset.label}: ${context.parsed.y.toFixed(3)} kWh`;
-          }
-        }
-      }
-    },
-    scales: {
-      x: {
-        type: 'time' as const,
-        time: {
-          displayFormats: {
-            hour: 'HH:mm',
-            day: 'MM/dd'
-          }
-        },
-        title: {
-          display: true,
-          text: 'Time (AEST)'
-        }
-      },
-      y: {
-        title: {
-          display: true,
-          text: 'Usage (kWh)'
-        }
-      }
-    },
-    maintainAspectRatio: false
-  };
-
   return (
     <div className="h-96">
-      <Line data={chartData} options={options} />
+      <Line data={chartData} options={chartOptions} />
     </div>
   );
 }
\ No newline at end of file
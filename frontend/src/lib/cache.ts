@@ -0,0 +1,62 @@
+/**
+ * Response caching helpers for Amber-Home Frontend Application.
+ */
+
+// Amber publishes 5-minute intervals and the collector runs on the same cadence
+export const DATA_BUCKET_SECONDS = 5 * 60;
+
+export function secondsUntilNextBucket(now: number = Date.now()): number {
+  const elapsed = Math.floor(now / 1000) % DATA_BUCKET_SECONDS;
+  return Math.max(DATA_BUCKET_SECONDS - elapsed, 1);
+}
+
+// Lets the browser (and any shared cache in front of Next.js) reuse a response
+// until the current 5-minute bucket ends, so repeat views skip the database.
+export function bucketCacheHeaders(): Record<string, string> {
+  const maxAge = secondsUntilNextBucket();
+  return {
+    'Cache-Control': `public, max-age=${maxAge}, s-maxage=${maxAge}`
+  };
+}
+
+// Serve a cached, already-serialized JSON body without re-encoding it
+export function cachedJsonResponse(body: string): Response {
+  return new Response(body, {
+    headers: {
+      'Content-Type': 'application/json',
+      ...bucketCacheHeaders()
+    }
+  });
+}
+
+// Slow-moving aggregates (usage usually lands a day late) can be reused longer
+export const COST_STATS_TTL_SECONDS = 60 * 60;
+
+interface CacheEntry {
+  expiresAt: number;
+  value: Promise<unknown>;
+}
+
+const entries = new Map<string, CacheEntry>();
+
+// In-process TTL cache for route loaders. The promise itself is stored so
+// concurrent requests for the same key share one database round-trip.
+export function cached<T>(key: string, ttlSeconds: number, load: () => Promise<T>): Promise<T> {
+  const now = Date.now();
+  const hit = entries.get(key);
+  if (hit && hit.expiresAt > now) {
+    return hit.value as Promise<T>;
+  }
+
+  const value = load();
+  entries.set(key, { expiresAt: now + ttlSeconds * 1000, value });
+
+  // Never keep a failed load around
+  value.catch(() => {
+    if (entries.get(key)?.value === value) {
+      entries.delete(key);
+    }
+  });
+
+  return value;
+}
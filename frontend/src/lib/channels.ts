@@ -0,0 +1,43 @@
+/**
+ * Channel type helpers for Amber-Home Frontend Application.
+ */
+
+// The collector stores the SDK enum as text (e.g. 'ChannelType.GENERAL'),
+// so the set of distinct values is tiny. Each one is classified once and
+// every later row is a single Map lookup instead of a substring scan.
+export type ChannelKind = 'import' | 'export' | 'other';
+
+const channelKinds = new Map<string, ChannelKind>();
+
+export function channelKind(channelType: string | null | undefined): ChannelKind {
+  if (!channelType) return 'other';
+
+  let kind = channelKinds.get(channelType);
+  if (kind === undefined) {
+    if (channelType.includes('GENERAL')) {
+      kind = 'import';
+    } else if (channelType.includes('FEEDIN')) {
+      kind = 'export';
+    } else {
+      kind = 'other';
+    }
+    channelKinds.set(channelType, kind);
+  }
+  return kind;
+}
+
+export function splitByChannel<T extends { channel_type: string }>(rows: T[]): { importRows: T[]; exportRows: T[] } {
+  const importRows: T[] = [];
+  const exportRows: T[] = [];
+
+  for (const row of rows) {
+    const kind = channelKind(row.channel_type);
+    if (kind === 'import') {
+      importRows.push(row);
+    } else if (kind === 'export') {
+      exportRows.push(row);
+    }
+  }
+
+  return { importRows, exportRows };
+}
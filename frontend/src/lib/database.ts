@@ -39,7 +39,6 @@ export interface DailyData {
   daily_cost_net: number;
   daily_kwh_import: number;
   daily_kwh_export: number;
-  record_count: number;
 }
 
 export interface ForecastData {
@@ -58,7 +57,14 @@ export interface ForecastData {
   range_high: number;
 }
 
+export type ChartPriceData = Pick<PriceData, 'aest_time' | 'channel_type' | 'per_kwh'>;
+
+export type ChartForecastData = Pick<
+  ForecastData,
+  'aest_time' | 'channel_type' | 'per_kwh' | 'advanced_price_low' | 'advanced_price_high'
+>;
+
 export interface CombinedPriceData {
-  historical: PriceData[];
-  forecast: ForecastData[];
+  historical: ChartPriceData[];
+  forecast: ChartForecastData[];
 }
\ No newline at end of file
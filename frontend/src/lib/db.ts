@@ -0,0 +1,25 @@
+/**
+ * Shared PostgreSQL connection pool for the API routes.
+ */
+
+import { Pool, types } from 'pg';
+
+// Decode NUMERIC (OID 1700) columns as numbers instead of strings
+types.setTypeParser(1700, parseFloat);
+
+// Keep a single pool across dev hot reloads instead of leaking one per reload
+const globalForPool = globalThis as unknown as { amberPool?: Pool };
+
+export const pool = globalForPool.amberPool ?? new Pool({
+  connectionString: process.env.DATABASE_URL,
+  ssl: process.env.NODE_ENV === 'production' ? { rejectUnauthorized: false } : false,
+  max: 10,
+  idleTimeoutMillis: 30000
+});
+
+// Routes pass a statement `name` with their fixed SQL so each pooled connection
+// parses and plans it once, then re-executes the prepared statement.
+
+if (process.env.NODE_ENV !== 'production') {
+  globalForPool.amberPool = pool;
+}
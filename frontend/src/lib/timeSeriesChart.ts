@@ -0,0 +1,42 @@
+/**
+ * Shared Chart.js setup for the time-series line charts.
+ */
+
+import {
+  Chart as ChartJS,
+  CategoryScale,
+  LinearScale,
+  PointElement,
+  LineElement,
+  Title,
+  Tooltip,
+  Legend,
+  TimeScale,
+  Filler,
+  Decimation
+} from 'chart.js';
+import 'chartjs-adapter-date-fns';
+
+// Registered once here rather than repeated in every chart component
+ChartJS.register(
+  CategoryScale,
+  LinearScale,
+  PointElement,
+  LineElement,
+  Title,
+  Tooltip,
+  Legend,
+  TimeScale,
+  Filler,
+  Decimation
+);
+
+// Largest-Triangle-Three-Buckets downsampling, applied only once a series has
+// more points than the canvas can show (needs parsing: false and a time x axis)
+export const decimation = {
+  enabled: true,
+  algorithm: 'lttb' as const,
+  samples: 500
+};
+
+export { ChartJS };